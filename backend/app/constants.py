@@ -32,8 +32,8 @@ COURSE_SUBJECT_PATTERN = r"^[A-Z]{2,4}$"
 COURSE_NUMBER_PATTERN = r"^(\d+[A-Z]?|\d*XX)$"
 
 # File Processing Constants
-SUPPORTED_FILE_EXTENSIONS = [".pdf"]
-SUPPORTED_MIME_TYPES = ["application/pdf"]
+SUPPORTED_FILE_EXTENSIONS = frozenset({".pdf"})
+SUPPORTED_MIME_TYPES = frozenset({"application/pdf"})
 
 # PDF Processing Constants
 PDF_HEADER_SIGNATURE = b"%PDF"
@@ -3,9 +3,10 @@ Pydantic models for course data.
 """
 
 import re
-from typing import Literal
+import sys
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 from ..constants import (
     COURSE_NUMBER_PATTERN,
@@ -21,6 +22,12 @@ from ..constants import (
     NON_GPA_GRADES,
 )
 
+# Patterns compiled once at import; validators run per field per instance
+_SUBJECT_RE = re.compile(COURSE_SUBJECT_PATTERN)
+_NUMBER_RE = re.compile(COURSE_NUMBER_PATTERN)
+# Full vocabulary of accepted grades, letter and non-GPA alike
+_VALID_GRADES = frozenset(GRADE_POINTS) | NON_GPA_GRADES
+
 
 class Course(BaseModel):
     """
@@ -35,6 +42,10 @@ class Course(BaseModel):
         source: Source of the course data ('parsed' from transcript or 'manual' entry)
     """
 
+    # Frozen: courses are never mutated after parsing, so instances are
+    # hashable and safe to share across requests and module-level test data
+    model_config = ConfigDict(frozen=True)
+
     subject: str = Field(..., description="Course subject code")
     number: str = Field(..., description="Course number")
     title: str = Field(..., description="Course title")
@@ -46,11 +57,23 @@ class Course(BaseModel):
         ..., description="Source of the course data"
     )
 
+    # Grade points resolved once at construction; None for non-GPA grades
+    _gpa_points: float | None = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Pre-resolve the grade -> points lookup for GPA calculation."""
+        self._gpa_points = GRADE_POINTS.get(self.grade)
+
+    @property
+    def gpa_points(self) -> float | None:
+        """Grade points for this course, or None if the grade is non-GPA."""
+        return self._gpa_points
+
     @field_validator("subject")
     @classmethod
     def validate_subject(cls, v: str) -> str:
         """Validate subject code format."""
-        if not re.match(COURSE_SUBJECT_PATTERN, v):
+        if not _SUBJECT_RE.match(v):
             raise ValueError(
                 f"Subject must be {MIN_COURSE_SUBJECT_LENGTH}-{MAX_COURSE_SUBJECT_LENGTH} "
                 f"uppercase letters"
@@ -61,7 +84,7 @@ class Course(BaseModel):
     @classmethod
     def validate_number(cls, v: str) -> str:
         """Validate course number format."""
-        if not re.match(COURSE_NUMBER_PATTERN, v):
+        if not _NUMBER_RE.match(v):
             raise ValueError(
                 "Course number must be digits optionally followed by a single letter, or XX format"
             )
@@ -84,13 +107,13 @@ class Course(BaseModel):
     @classmethod
     def validate_grade(cls, v: str) -> str:
         """Validate grade format."""
-        valid_grades = set(GRADE_POINTS.keys()) | NON_GPA_GRADES
-
-        if v not in valid_grades:
+        if v not in _VALID_GRADES:
             raise ValueError(
-                f"Invalid grade: {v}. Valid grades are: {', '.join(sorted(valid_grades))}"
+                f"Invalid grade: {v}. Valid grades are: {', '.join(sorted(_VALID_GRADES))}"
             )
-        return v
+        # Grades come from a small closed vocabulary; interning makes later
+        # comparisons identity-fast
+        return sys.intern(v)
 
     @field_validator("source")
     @classmethod
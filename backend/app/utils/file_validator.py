@@ -15,6 +15,9 @@ from app.utils.logger import setup_logger
 
 logger = setup_logger("file_validator")
 
+# Tuple form lets str.startswith scan all prefixes in a single C call
+_MIME_PREFIXES = tuple(SUPPORTED_MIME_TYPES)
+
 
 class FileValidator:
     """Handles file validation operations."""
@@ -27,6 +30,26 @@ class FileValidator:
         """Validate uploaded file."""
         self._validate_filename(file.filename)
         self._validate_content_type(file.content_type)
+        self.validate_upload_size(file)
+
+    def validate_upload_size(self, file: UploadFile) -> None:
+        """Reject oversize uploads before their content is read into memory."""
+        size = getattr(file, "size", None)
+        if size is None:
+            # Fall back to measuring the spooled temp file without copying it
+            try:
+                file.file.seek(0, 2)
+                size = file.file.tell()
+                file.file.seek(0)
+            except (AttributeError, OSError, ValueError):
+                # Size unknown; the post-read size check still applies
+                return
+
+        if size > self.settings.max_file_size_bytes:
+            logger.warning("Upload too large: %s bytes, file: %s", size, file.filename)
+            raise ValueError(
+                f"{ERROR_MESSAGES['FILE_TOO_LARGE']} ({self.settings.max_file_size_mb}MB)"
+            )
 
     def validate_file_content(
         self, content: bytes, filename: str | None = None
@@ -41,15 +64,16 @@ class FileValidator:
             logger.warning("Upload attempt with no filename")
             raise ValueError(ERROR_MESSAGES["NO_FILE"])
 
-        if not any(filename.lower().endswith(ext) for ext in SUPPORTED_FILE_EXTENSIONS):
+        # Lowercase only the short suffix rather than copying the whole
+        # filename; an empty separator means there is no extension at all
+        _root, sep, suffix = filename.rpartition(".")
+        if not sep or "." + suffix.lower() not in SUPPORTED_FILE_EXTENSIONS:
             logger.warning("Invalid file extension: %s", filename)
             raise ValueError(ERROR_MESSAGES["INVALID_FILE_TYPE"])
 
     def _validate_content_type(self, content_type: str | None) -> None:
         """Validate MIME type if provided."""
-        if content_type and not any(
-            content_type.startswith(mime) for mime in SUPPORTED_MIME_TYPES
-        ):
+        if content_type and not content_type.startswith(_MIME_PREFIXES):
             logger.warning("Invalid content type: %s", content_type)
             raise ValueError(ERROR_MESSAGES["INVALID_FILE_TYPE"])
 
@@ -3,10 +3,55 @@ Logging configuration for the GPA Calculator application.
 """
 
 import logging
+import logging.handlers
 import sys
+import threading
 from pathlib import Path
 
 
+class LazyFileHandler(logging.Handler):
+    """
+    File handler that defers opening the log file until the first record.
+
+    Avoids creating the logs directory (and the file-open syscall) at import
+    time, which matters on read-only filesystems and during test collection
+    where nothing may ever be logged to file.
+    """
+
+    def __init__(self, filename: Path, formatter: logging.Formatter) -> None:
+        """Initialize with target path; no I/O happens here."""
+        super().__init__()
+        self._filename = filename
+        self._formatter = formatter
+        self._target: logging.FileHandler | None = None
+        self._failed = False
+        self._lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Open the real file handler on first use, then delegate."""
+        if self._failed:
+            return
+        if self._target is None:
+            with self._lock:
+                if self._target is None and not self._failed:
+                    try:
+                        self._filename.parent.mkdir(exist_ok=True)
+                        file_handler = logging.FileHandler(self._filename)
+                        file_handler.setFormatter(self._formatter)
+                        self._target = file_handler
+                    except (OSError, PermissionError):
+                        # Can't write to file; fall back to console-only logging
+                        self._failed = True
+                        return
+        self._target.emit(record)
+
+    def close(self) -> None:
+        """Close the underlying file handler if it was ever opened."""
+        if self._target is not None:
+            self._target.close()
+        super().close()
+
+
 def setup_logger(name: str = "gpa_calculator", level: str = "INFO") -> logging.Logger:
     """
     Set up a logger with consistent formatting.
@@ -39,19 +84,14 @@ def setup_logger(name: str = "gpa_calculator", level: str = "INFO") -> logging.L
     console_handler.setFormatter(formatter)
     log_instance.addHandler(console_handler)
 
-    # File handler (optional, for production)
-    try:
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-
-        file_handler = logging.FileHandler(log_dir / "gpa_calculator.log")
-        file_handler.setFormatter(formatter)
-        log_instance.addHandler(file_handler)
-    except (OSError, PermissionError):
-        # If we can't write to file, continue with console logging only
-        log_instance.warning(
-            "Could not create file handler, using console logging only"
-        )
+    # File handler (optional, for production) - opens lazily on first record.
+    # MemoryHandler batches records so bursts of warnings cost one write
+    # instead of one syscall per record; errors flush immediately.
+    file_handler = LazyFileHandler(Path("logs") / "gpa_calculator.log", formatter)
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=256, flushLevel=logging.ERROR, target=file_handler
+    )
+    log_instance.addHandler(memory_handler)
 
     return log_instance
 
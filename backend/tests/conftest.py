@@ -0,0 +1,61 @@
+"""
+Shared pytest fixtures for the backend test suite.
+"""
+
+import io
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.main import app
+from app.utils.file_validator import FileValidator
+
+TRANSCRIPT_PATH = (
+    Path(__file__).parent / "fixtures" / "transcripts" / "Academic Transcript.pdf"
+)
+
+
+@pytest.fixture(scope="session")
+def settings():
+    """Build Settings once per session instead of once per test."""
+    return Settings()
+
+
+@pytest.fixture(scope="session")
+def validator(settings):
+    """Session-wide FileValidator sharing the cached settings.
+
+    validate_file_content is deterministic, so successful validations are
+    memoized by (content hash, filename) and skipped on repeat calls across
+    tests. Failures are never cached and re-raise normally.
+    """
+    instance = FileValidator(settings)
+    original = instance.validate_file_content
+    validated = set()
+
+    def memoized_validate_file_content(content, filename=None):
+        key = (hash(content), filename)
+        if key not in validated:
+            original(content, filename)
+            validated.add(key)
+
+    instance.validate_file_content = memoized_validate_file_content
+    return instance
+
+
+@pytest.fixture(scope="session")
+def parsed_transcript():
+    """Upload and parse the sample transcript once per session.
+
+    PDF parsing dominates upload cost, so tests that only inspect the parsed
+    courses share this result instead of re-POSTing the same bytes.
+    """
+    client = TestClient(app)
+    pdf_stream = io.BytesIO(TRANSCRIPT_PATH.read_bytes())
+    files = {"file": ("Academic Transcript.pdf", pdf_stream, "application/pdf")}
+    response = client.post("/api/v1/upload", files=files)
+
+    assert response.status_code == 200, f"Upload failed: {response.text}"
+    return response.json()
@@ -5,10 +5,24 @@ Tests for FastAPI endpoints.
 import io
 from pathlib import Path
 
+import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
 
+_TRANSCRIPT_PATH = (
+    Path(__file__).parent / "fixtures" / "transcripts" / "Academic Transcript.pdf"
+)
+
+# Fields every serialized course must carry
+_REQUIRED_FIELDS = frozenset({"subject", "number", "title", "units", "grade", "source"})
+
+
+@pytest.fixture(scope="module")
+def pdf_bytes():
+    """Transcript bytes read once per module; tests wrap them in BytesIO."""
+    return _TRANSCRIPT_PATH.read_bytes()
+
 
 class TestAPIEndpoints:
     """Test cases for API endpoint functionality."""
@@ -16,19 +30,21 @@ class TestAPIEndpoints:
     def setup_method(self):
         """Set up test fixtures."""
         self.client = TestClient(app)
-        self.test_transcript_path = (
-            Path(__file__).parent
-            / "fixtures"
-            / "transcripts"
-            / "Academic Transcript.pdf"
-        )
 
-    def test_upload_valid_pdf(self):
+    @pytest.mark.skipif(
+        not _TRANSCRIPT_PATH.exists(), reason="sample transcript PDF missing"
+    )
+    def test_upload_valid_pdf(self, pdf_bytes):
         """Test /upload endpoint with valid PDF file."""
         # Use the actual transcript PDF for testing
-        with open(self.test_transcript_path, "rb") as pdf_file:
-            files = {"file": ("Academic Transcript.pdf", pdf_file, "application/pdf")}
-            response = self.client.post("/api/v1/upload", files=files)
+        files = {
+            "file": (
+                "Academic Transcript.pdf",
+                io.BytesIO(pdf_bytes),
+                "application/pdf",
+            )
+        }
+        response = self.client.post("/api/v1/upload", files=files)
 
         assert response.status_code == 200, (
             f"Expected 200, got {response.status_code}: {response.text}"
@@ -40,11 +56,10 @@ class TestAPIEndpoints:
             f"Should parse exactly 44 courses from Academic Transcript.pdf, got {len(data)}"
         )
 
-        # Validate course structure
+        # Validate course structure with a single C-level set comparison
         course = data[0]
-        required_fields = {"subject", "number", "title", "units", "grade", "source"}
-        assert all(field in course for field in required_fields), (
-            f"Course missing required fields: {course}"
+        assert course.keys() >= _REQUIRED_FIELDS, (
+            f"Course missing required fields {_REQUIRED_FIELDS - course.keys()}: {course}"
         )
 
         # Check that we have different types of courses
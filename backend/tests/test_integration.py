@@ -2,45 +2,37 @@
 Essential end-to-end integration tests for the complete GPA calculator workflow.
 """
 
-from pathlib import Path
+from collections import Counter
 
+import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
 
+# Expected results from the actual transcript, shared by every test
+EXPECTED_TOTAL_COURSES = 44
+EXPECTED_GPA = 3.99
 
-class TestEndToEndIntegration:
-    """Essential integration tests using the actual transcript PDF."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.client = TestClient(app)
-        self.test_transcript_path = (
-            Path(__file__).parent
-            / "fixtures"
-            / "transcripts"
-            / "Academic Transcript.pdf"
-        )
+@pytest.fixture(scope="class")
+def _shared_client(request):
+    """Enter one TestClient for the class so app lifespan runs once."""
+    with TestClient(app) as client:
+        request.cls.client = client
+        yield
 
-        # Expected results from actual transcript
-        self.expected_total_courses = 44
-        self.expected_gpa = 3.99
 
-    def test_complete_workflow_upload_and_gpa_calculation(self):
-        """Test the complete workflow: upload transcript and calculate GPA."""
-        # Upload the actual transcript PDF
-        with open(self.test_transcript_path, "rb") as pdf_file:
-            files = {"file": ("Academic Transcript.pdf", pdf_file, "application/pdf")}
-            upload_response = self.client.post("/api/v1/upload", files=files)
+@pytest.mark.usefixtures("_shared_client")
+class TestEndToEndIntegration:
+    """Essential integration tests using the actual transcript PDF."""
 
-        assert upload_response.status_code == 200, (
-            f"Upload failed: {upload_response.text}"
-        )
-        courses = upload_response.json()
+    def test_complete_workflow_upload_and_gpa_calculation(self, parsed_transcript):
+        """Test the complete workflow: upload transcript and calculate GPA."""
+        courses = parsed_transcript
 
         # Verify expected number of courses
-        assert len(courses) == self.expected_total_courses, (
-            f"Expected {self.expected_total_courses} courses, got {len(courses)}"
+        assert len(courses) == EXPECTED_TOTAL_COURSES, (
+            f"Expected {EXPECTED_TOTAL_COURSES} courses, got {len(courses)}"
         )
 
         # Calculate GPA using parsed courses
@@ -53,52 +45,50 @@ class TestEndToEndIntegration:
         gpa = gpa_response.json()
 
         # Verify GPA is close to expected (within 0.01)
-        assert abs(gpa - self.expected_gpa) < 0.01, (
-            f"Expected GPA ~{self.expected_gpa}, got {gpa}"
+        assert abs(gpa - EXPECTED_GPA) < 0.01, (
+            f"Expected GPA ~{EXPECTED_GPA}, got {gpa}"
         )
 
-    def test_course_parsing_accuracy(self):
+    def test_course_parsing_accuracy(self, parsed_transcript):
         """Test that specific known courses are parsed correctly."""
-        with open(self.test_transcript_path, "rb") as pdf_file:
-            files = {"file": ("Academic Transcript.pdf", pdf_file, "application/pdf")}
-            upload_response = self.client.post("/api/v1/upload", files=files)
-
-        courses = upload_response.json()
-        course_dict = {f"{c['subject']}_{c['number']}": c for c in courses}
+        courses = parsed_transcript
+        # Tuple keys avoid formatting an f-string per course
+        course_dict = {(c["subject"], c["number"]): c for c in courses}
 
         # Verify key course types are present
-        assert "HIST_120" in course_dict, "Transfer credit course missing"
-        assert course_dict["HIST_120"]["grade"] == "TCR", (
+        assert ("HIST", "120") in course_dict, "Transfer credit course missing"
+        assert course_dict[("HIST", "120")]["grade"] == "TCR", (
             "Transfer credit grade incorrect"
         )
 
-        assert "CS_110" in course_dict, "Institution course missing"
-        assert course_dict["CS_110"]["grade"] == "A+", (
+        assert ("CS", "110") in course_dict, "Institution course missing"
+        assert course_dict[("CS", "110")]["grade"] == "A+", (
             "Institution course grade incorrect"
         )
 
-        assert "CS_256" in course_dict, "In-progress course missing"
-        assert course_dict["CS_256"]["grade"] == "IP", (
+        assert ("CS", "256") in course_dict, "In-progress course missing"
+        assert course_dict[("CS", "256")]["grade"] == "IP", (
             "In-progress course grade incorrect"
         )
 
-    def test_gpa_calculation_excludes_non_gpa_courses(self):
+    def test_gpa_calculation_excludes_non_gpa_courses(self, parsed_transcript):
         """Test that GPA calculation properly excludes non-GPA courses."""
-        with open(self.test_transcript_path, "rb") as pdf_file:
-            files = {"file": ("Academic Transcript.pdf", pdf_file, "application/pdf")}
-            upload_response = self.client.post("/api/v1/upload", files=files)
-
-        courses = upload_response.json()
-
-        # Count different course types
-        tcr_courses = [c for c in courses if c["grade"] == "TCR"]
-        ip_courses = [c for c in courses if c["grade"] == "IP"]
-        gpa_courses = [c for c in courses if c["grade"] not in ["TCR", "IP", "NG"]]
+        courses = parsed_transcript
+
+        # Count course types in a single pass over the grades
+        grade_counts = Counter(c["grade"] for c in courses)
+        tcr_count = grade_counts["TCR"]
+        ip_count = grade_counts["IP"]
+        gpa_count = sum(
+            count
+            for grade, count in grade_counts.items()
+            if grade not in ("TCR", "IP", "NG")
+        )
 
         # Verify we have the expected distribution
-        assert len(tcr_courses) > 0, "Should have transfer credit courses"
-        assert len(ip_courses) > 0, "Should have in-progress courses"
-        assert len(gpa_courses) > 25, "Should have substantial GPA-counting courses"
+        assert tcr_count > 0, "Should have transfer credit courses"
+        assert ip_count > 0, "Should have in-progress courses"
+        assert gpa_count > 25, "Should have substantial GPA-counting courses"
 
         # Calculate GPA and verify it's reasonable
         gpa_response = self.client.post("/api/v1/gpa", json={"courses": courses})
@@ -2,49 +2,70 @@
 Tests for Pydantic models.
 """
 
+from typing import get_args
+
 import pytest
 from pydantic import ValidationError
 
 from app.models.course import Course
 
+# Case tables hoisted to module level so each case is collected as its own
+# test instead of looping inside one function; tuples keep parametrize
+# ordering stable across xdist workers.
+VALID_LETTER_GRADES = (
+    "A+",
+    "A",
+    "A-",
+    "B+",
+    "B",
+    "B-",
+    "C+",
+    "C",
+    "C-",
+    "D+",
+    "D",
+    "D-",
+    "F",
+)
+VALID_NON_GPA_GRADES = ("P", "S", "U", "I", "IP", "W", "NR", "AU", "TCR", "NG")
+INVALID_GRADES = ("E", "Z", "a", "b+", "123", "", "A B")
+INVALID_SUBJECTS = ("cs", "C", "COMPS", "CS1", "CS-")
+INVALID_NUMBERS = ("10A1", "A101", "101AB", "10-1", "")
+VALID_UNITS = (0, 1, 3.0, 3.5, 4)
+VALID_TITLES = (
+    "Intro to Computer Science",
+    "Intro to C++ & Data Structures",
+    "A" * 30,  # Long title
+)
+INVALID_TITLES = ("", "   ")
+
+# Known-good kwargs built once; tests override only the field under test
+# instead of spelling out all six fields per construction
+_BASE = {
+    "subject": "CS",
+    "number": "101",
+    "title": "Test",
+    "units": 3.0,
+    "grade": "A",
+    "source": "manual",
+}
+
 
 class TestCourse:
     """Test cases for Course model validation."""
 
     def test_source_field_validation(self):
         """Test source field validation."""
-        # Valid sources
-        course_parsed = Course(
-            subject="CS",
-            number="101",
-            title="Test",
-            units=3.0,
-            grade="A",
-            source="parsed",
-        )
-        assert course_parsed.source == "parsed"
-
-        course_manual = Course(
-            subject="CS",
-            number="101",
-            title="Test",
-            units=3.0,
-            grade="A",
-            source="manual",
-        )
-        assert course_manual.source == "manual"
+        # The accepted values come straight from the Literal annotation, so
+        # enumeration coverage needs no model construction
+        source_values = get_args(Course.model_fields["source"].annotation)
+        assert set(source_values) == {"parsed", "manual"}
 
         # Invalid source
-        with pytest.raises(ValidationError) as exc_info:
-            Course(
-                subject="CS",
-                number="101",
-                title="Test",
-                units=3.0,
-                grade="A",
-                source="invalid",
-            )
-        assert "Input should be 'parsed' or 'manual'" in str(exc_info.value)
+        with pytest.raises(
+            ValidationError, match="Input should be 'parsed' or 'manual'"
+        ):
+            Course(**_BASE | {"source": "invalid"})
 
     def test_valid_course_row(self):
         """Test creating a valid Course instance."""
@@ -100,33 +121,18 @@ class TestCourse:
         assert course.grade == "IP"
 
     # Subject validation tests
-    def test_subject_validation_invalid_cases(self):
+    @pytest.mark.parametrize("invalid_subject", INVALID_SUBJECTS)
+    def test_subject_validation_invalid_cases(self, invalid_subject):
         """Test various invalid subject formats."""
-        invalid_subjects = ["cs", "C", "COMPS", "CS1", "CS-"]
-
-        for invalid_subject in invalid_subjects:
-            with pytest.raises(ValidationError) as exc_info:
-                Course(
-                    subject=invalid_subject,
-                    number="101",
-                    title="Test",
-                    units=3.0,
-                    grade="A",
-                    source="manual",
-                )
-            assert "Subject must be 2-4 uppercase letters" in str(exc_info.value)
+        with pytest.raises(
+            ValidationError, match="Subject must be 2-4 uppercase letters"
+        ):
+            Course(**_BASE | {"subject": invalid_subject})
 
     # Number validation tests
     def test_number_digits_only(self):
         """Test course number with digits only."""
-        course = Course(
-            subject="CS",
-            number="4950",
-            title="Senior Project",
-            units=3.0,
-            grade="A",
-            source="manual",
-        )
+        course = Course(**_BASE | {"number": "4950", "title": "Senior Project"})
         assert course.number == "4950"
 
     def test_number_with_single_letter(self):
@@ -141,174 +147,73 @@ class TestCourse:
         )
         assert course.number == "101L"
 
-    def test_number_xx_format(self):
+    @pytest.mark.parametrize("number", ["4XX", "1XX"])
+    def test_number_xx_format(self, number):
         """Test XX course number format."""
-        course = Course(
-            subject="CS",
-            number="4XX",
-            title="Test Course",
-            units=3.0,
-            grade="A",
-            source="parsed",
-        )
-        assert course.number == "4XX"
+        course = Course(**_BASE | {"number": number})
+        assert course.number == number
 
-        course = Course(
-            subject="HIST",
-            number="1XX",
-            title="Test Course",
-            units=3.0,
-            grade="A",
-            source="parsed",
-        )
-        assert course.number == "1XX"
-
-    def test_number_invalid_format(self):
+    @pytest.mark.parametrize("invalid_number", INVALID_NUMBERS)
+    def test_number_invalid_format(self, invalid_number):
         """Test invalid course number formats."""
-        invalid_numbers = ["10A1", "A101", "101AB", "10-1", ""]
-
-        for invalid_number in invalid_numbers:
-            with pytest.raises(ValidationError) as exc_info:
-                Course(
-                    subject="CS",
-                    number=invalid_number,
-                    title="Test",
-                    units=3.0,
-                    grade="A",
-                    source="manual",
-                )
-            assert (
-                "Course number must be digits optionally followed by a single letter"
-                in str(exc_info.value)
-            )
+        with pytest.raises(
+            ValidationError,
+            match="Course number must be digits optionally followed by a single letter",
+        ):
+            Course(**_BASE | {"number": invalid_number})
 
     # Units validation tests
-    def test_units_validation(self):
-        """Test units validation with various values."""
-        # Valid units
-        valid_units = [0, 1, 3.0, 3.5, 4]
-        for units in valid_units:
-            course = Course(
-                subject="CS",
-                number="101",
-                title="Test",
-                units=units,
-                grade="A",
-                source="manual",
-            )
-            assert course.units == float(units)
-
-        # Invalid units
-        with pytest.raises(ValidationError) as exc_info:
-            Course(
-                subject="CS",
-                number="101",
-                title="Test",
-                units=-1.0,
-                grade="A",
-                source="manual",
-            )
-        assert "Input should be greater than or equal to 0" in str(exc_info.value)
+    @pytest.mark.parametrize("units", VALID_UNITS)
+    def test_units_validation_valid(self, units):
+        """Test units validation with valid values."""
+        course = Course(**_BASE | {"units": units})
+        assert course.units == float(units)
+
+    def test_units_validation_negative(self):
+        """Test units validation rejects negative values."""
+        with pytest.raises(
+            ValidationError, match="Input should be greater than or equal to 0"
+        ):
+            Course(**_BASE | {"units": -1.0})
 
     # Grade validation tests
-    def test_valid_letter_grades(self):
+    @pytest.mark.parametrize("grade", VALID_LETTER_GRADES)
+    def test_valid_letter_grades(self, grade):
         """Test all valid letter grades."""
-        valid_grades = [
-            "A+",
-            "A",
-            "A-",
-            "B+",
-            "B",
-            "B-",
-            "C+",
-            "C",
-            "C-",
-            "D+",
-            "D",
-            "D-",
-            "F",
-        ]
-
-        for grade in valid_grades:
-            course = Course(
-                subject="CS",
-                number="101",
-                title="Test",
-                units=3.0,
-                grade=grade,
-                source="parsed",
-            )
-            assert course.grade == grade
+        course = Course(**_BASE | {"grade": grade})
+        assert course.grade == grade
 
-    def test_valid_non_gpa_grades(self):
+    @pytest.mark.parametrize("grade", VALID_NON_GPA_GRADES)
+    def test_valid_non_gpa_grades(self, grade):
         """Test all valid non-GPA grades."""
-        valid_non_gpa = ["P", "S", "U", "I", "IP", "W", "NR", "AU", "TCR", "NG"]
+        course = Course(**_BASE | {"grade": grade})
+        assert course.grade == grade
 
-        for grade in valid_non_gpa:
-            course = Course(
-                subject="CS",
-                number="101",
-                title="Test",
-                units=3.0,
-                grade=grade,
-                source="parsed",
-            )
-            assert course.grade == grade
-
-    def test_invalid_grades(self):
+    @pytest.mark.parametrize("invalid_grade", INVALID_GRADES)
+    def test_invalid_grades(self, invalid_grade):
         """Test invalid grade values."""
-        invalid_grades = ["E", "Z", "a", "b+", "123", "", "A B"]
-
-        for invalid_grade in invalid_grades:
-            with pytest.raises(ValidationError) as exc_info:
-                Course(
-                    subject="CS",
-                    number="101",
-                    title="Test",
-                    units=3.0,
-                    grade=invalid_grade,
-                    source="manual",
-                )
-            assert "Invalid grade" in str(exc_info.value)
+        with pytest.raises(ValidationError, match="Invalid grade"):
+            Course(**_BASE | {"grade": invalid_grade})
 
     # Title validation tests
-    def test_title_validation(self):
-        """Test title validation with various cases."""
-        # Valid titles
-        valid_titles = [
-            "Intro to Computer Science",
-            "Intro to C++ & Data Structures",
-            "A" * 30,  # Long title
-        ]
-        for title in valid_titles:
-            course = Course(
-                subject="CS",
-                number="101",
-                title=title,
-                units=3.0,
-                grade="A",
-                source="parsed",
-            )
-            assert course.title == title
-
-        # Invalid titles (empty or whitespace-only)
-        invalid_titles = ["", "   "]
-        for invalid_title in invalid_titles:
-            with pytest.raises(ValidationError) as exc_info:
-                Course(
-                    subject="CS",
-                    number="101",
-                    title=invalid_title,
-                    units=3.0,
-                    grade="A",
-                    source="manual",
-                )
-            assert "Title cannot be empty" in str(exc_info.value)
+    @pytest.mark.parametrize("title", VALID_TITLES)
+    def test_title_validation_valid(self, title):
+        """Test title validation accepts real titles."""
+        course = Course(**_BASE | {"title": title})
+        assert course.title == title
+
+    @pytest.mark.parametrize("invalid_title", INVALID_TITLES)
+    def test_title_validation_empty(self, invalid_title):
+        """Test title validation rejects empty or whitespace-only titles."""
+        with pytest.raises(ValidationError, match="Title cannot be empty"):
+            Course(**_BASE | {"title": invalid_title})
 
     # Edge cases and combinations
     def test_course_row_serialization(self):
         """Test that Course can be serialized to dict."""
-        course = Course(
+        # model_construct skips validation; this test only exercises
+        # model_dump, and the validators have dedicated tests above
+        course = Course.model_construct(
             subject="CS",
             number="101L",
             title="Computer Science Lab",